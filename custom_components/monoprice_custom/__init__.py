@@ -1,21 +1,26 @@
 """The Monoprice 6-Zone Amplifier integration."""
 import logging
 
-from pymonoprice import get_monoprice
-from serial import SerialException
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 
+from .bus import MonopriceBus
 from .const import (
     CONF_NOT_FIRST_RUN,
+    CONF_TCP_PORT,
     DOMAIN,
-    FIRST_RUN,
-    MONOPRICE_OBJECT,
+    ENTRY_OPTIONS,
+    MONOPRICE_BUS,
+    MONOPRICE_COORDINATOR,
+    MONOPRICE_MULTIPLEXER,
+    MONOPRICE_USAGE,
     UNDO_UPDATE_LISTENER,
 )
+from .coordinator import MonopriceCoordinator
+from .multiplexer import MonopriceMultiplexer
+from .usage import ZoneUsage
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR, Platform.NUMBER]
 
@@ -26,29 +31,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Monoprice 6-Zone Amplifier from a config entry."""
     port = entry.data[CONF_PORT]
 
-    try:
-        monoprice = await hass.async_add_executor_job(get_monoprice, port)
-    except SerialException as err:
-        _LOGGER.error("Error connecting to Monoprice controller at %s", port)
-        raise ConfigEntryNotReady from err
+    bus = MonopriceBus(hass, port)
+    usage = ZoneUsage(hass, entry.entry_id)
+    await usage.async_load()
+    coordinator = MonopriceCoordinator(hass, bus, usage)
 
     # double negative to handle absence of value
     first_run = not bool(entry.data.get(CONF_NOT_FIRST_RUN))
 
-    if first_run:
-        hass.config_entries.async_update_entry(
-            entry, data={**entry.data, CONF_NOT_FIRST_RUN: True}
-        )
+    multiplexer = None
+    if tcp_port := entry.options.get(CONF_TCP_PORT):
+        multiplexer = MonopriceMultiplexer(coordinator)
+        try:
+            await multiplexer.async_start(tcp_port)
+        except OSError as err:
+            _LOGGER.error("Could not listen on TCP port %d: %s", tcp_port, err)
+            multiplexer = None
 
     undo_listener = entry.add_update_listener(_update_listener)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        MONOPRICE_OBJECT: monoprice,
+        MONOPRICE_BUS: bus,
+        MONOPRICE_COORDINATOR: coordinator,
+        MONOPRICE_MULTIPLEXER: multiplexer,
+        MONOPRICE_USAGE: usage,
+        ENTRY_OPTIONS: dict(entry.options),
         UNDO_UPDATE_LISTENER: undo_listener,
-        FIRST_RUN: first_run,
     }
 
+    # entities registered by earlier setups; only newer ones are checked for
+    # absent units, so entities a user enabled again are left alone
+    registry = er.async_get(hass)
+    known = set() if first_run else _entity_ids(registry, entry)
+
+    # entities come up with their restored state; the port is opened and the
+    # first refresh done in the background so startup never waits on the amp
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    new_entities = _entity_ids(registry, entry) - known
+
+    @callback
+    def _async_connection_changed(connected: bool) -> None:
+        if connected:
+            _async_disable_absent_zones(hass, entry, coordinator, new_entities)
+
+    entry.async_on_unload(bus.async_add_listener(_async_connection_changed))
+    bus.async_start()
+
+    if first_run:
+        first_run_task = hass.async_create_background_task(
+            _async_first_run(hass, entry, coordinator), f"monoprice first run {port}"
+        )
+        entry.async_on_unload(first_run_task.cancel)
 
     return True
 
@@ -58,6 +91,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN][entry.entry_id][UNDO_UPDATE_LISTENER]()
+        if (multiplexer := hass.data[DOMAIN][entry.entry_id][MONOPRICE_MULTIPLEXER]) is not None:
+            await multiplexer.async_stop()
+        await hass.data[DOMAIN][entry.entry_id][MONOPRICE_BUS].async_shutdown()
+        await hass.data[DOMAIN][entry.entry_id][MONOPRICE_USAGE].async_save()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
@@ -65,4 +102,58 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
+    # the first run flag is written to entry data after setup; only options need a reload
+    if entry.options == hass.data[DOMAIN][entry.entry_id][ENTRY_OPTIONS]:
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_first_run(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: MonopriceCoordinator
+) -> None:
+    """Record the first run once the hardware has been identified."""
+    # absent expansion units are disabled by the connection listener
+    await coordinator.bus.async_wait_connected()
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_NOT_FIRST_RUN: True}
+    )
+
+
+def _entity_ids(registry: er.EntityRegistry, entry: ConfigEntry) -> set[str]:
+    """Return the ids of the entities registered for a config entry."""
+    return {
+        registry_entry.entity_id
+        for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+    }
+
+
+@callback
+def _async_disable_absent_zones(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: MonopriceCoordinator,
+    entity_ids: set[str],
+) -> None:
+    """Disable the entities of expansion units that did not answer at connect.
+
+    Each entity is checked at the first connect only and then removed from
+    entity_ids.
+    """
+    registry = er.async_get(hass)
+    while entity_ids:
+        if (registry_entry := registry.async_get(entity_ids.pop())) is None:
+            continue
+        zone = registry_entry.unique_id.removeprefix(f"{entry.entry_id}_").split("_")[0]
+        # stack-wide entities are not tied to a zone
+        if not zone.isdigit():
+            continue
+        zone_id = int(zone)
+        if (
+            zone_id < 20
+            or zone_id // 10 in coordinator.bus.units
+            or registry_entry.disabled_by is not None
+        ):
+            continue
+        registry.async_update_entity(
+            registry_entry.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+        )
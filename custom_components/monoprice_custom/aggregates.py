@@ -0,0 +1,72 @@
+"""Aggregates over the zone table of a Monoprice 6-Zone Amplifier stack."""
+from __future__ import annotations
+
+from collections import defaultdict
+
+from pymonoprice import ZoneStatus
+
+
+class ZoneAggregates:
+    """Keep stack-wide totals up to date one zone at a time.
+
+    Each zone's contribution is removed and re-added only when its power,
+    mute or source changes, so reading any aggregate never has to walk the
+    whole zone table.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates."""
+        # zone_id -> (power, mute, source) as last counted
+        self._zones: dict[int, tuple[bool, bool, int]] = {}
+        self.zones_on: set[int] = set()
+        # zones that are on and not muted
+        self.unmuted_zones: set[int] = set()
+        # source_id -> zones that are on and playing it
+        self.source_zones: defaultdict[int, set[int]] = defaultdict(set)
+        # unit -> zones of that unit that are on
+        self.unit_zones_on: defaultdict[int, set[int]] = defaultdict(set)
+
+    def update(self, zone_id: int, status: ZoneStatus | None) -> bool:
+        """Count a zone's new status; return True if any aggregate changed.
+
+        A zone that did not answer keeps its last counted status.
+        """
+        if status is None:
+            return False
+        new = (bool(status.power), bool(status.mute), status.source)
+        old = self._zones.get(zone_id)
+        if new == old:
+            return False
+        if old is not None:
+            self._remove(zone_id, *old)
+        self._zones[zone_id] = new
+        self._add(zone_id, *new)
+        return True
+
+    def counted(self, zones) -> bool:
+        """Return True if every one of the zones has been counted."""
+        return all(zone_id in self._zones for zone_id in zones)
+
+    def remove(self, zone_id: int) -> bool:
+        """Stop counting a zone; return True if any aggregate changed."""
+        if (old := self._zones.pop(zone_id, None)) is None:
+            return False
+        self._remove(zone_id, *old)
+        return old[0]
+
+    def _add(self, zone_id: int, power: bool, mute: bool, source: int) -> None:
+        if not power:
+            return
+        self.zones_on.add(zone_id)
+        self.unit_zones_on[zone_id // 10].add(zone_id)
+        self.source_zones[source].add(zone_id)
+        if not mute:
+            self.unmuted_zones.add(zone_id)
+
+    def _remove(self, zone_id: int, power: bool, mute: bool, source: int) -> None:
+        if not power:
+            return
+        self.zones_on.discard(zone_id)
+        self.unit_zones_on[zone_id // 10].discard(zone_id)
+        self.source_zones[source].discard(zone_id)
+        self.unmuted_zones.discard(zone_id)
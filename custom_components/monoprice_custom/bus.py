@@ -0,0 +1,383 @@
+"""Serial bus worker for the Monoprice 6-Zone Amplifier integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import logging
+import time
+from typing import Any
+
+from pymonoprice import get_monoprice
+from serial import SerialException, SerialTimeoutException
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .pacing import UnitPacing
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+UNITS = (1, 2, 3)
+
+# pymonoprice methods that send several requests in one call
+MULTI_REQUEST_METHODS = ("restore_zone",)
+
+
+def _is_link_error(err: Exception) -> bool:
+    """Return True if an error means the port itself is gone.
+
+    A read timeout only means a unit did not answer; anything else raised by
+    pyserial (or the OS) means the adapter has to be reopened.
+    """
+    return isinstance(err, OSError) and not isinstance(err, SerialTimeoutException)
+
+
+class MonopriceBus:
+    """Own a single serial port and run every request for it in order.
+
+    Each config entry gets its own bus with a dedicated worker thread and
+    request queue, so polls and commands for one amplifier stack never wait
+    behind another stack or behind Home Assistant's shared executor.
+
+    A supervisor task opens the port, reopens it with back-off whenever the
+    link dies, and replays the latest pending command for each setting once
+    the amplifier is back.
+
+    Requests are paced per unit from measured reply times (see UnitPacing),
+    and a command whose reply never arrives is sent once more.
+    """
+
+    def __init__(self, hass: HomeAssistant, port: str) -> None:
+        """Initialize the bus for a serial port."""
+        self._hass = hass
+        self.port = port
+        self.units: set[int] = set()
+        self.pacing = {unit: UnitPacing() for unit in UNITS}
+        self._last_request = 0.0
+        self._monoprice = None
+        # port opened by the worker thread but not yet handed to the bus
+        self._opened = None
+        self._shutdown = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"monoprice_{port}"
+        )
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        # (method, zone_id) -> [args, futures] of the newest command not yet sent
+        self._pending: dict[tuple[str, int], list] = {}
+        self._link_lost = asyncio.Event()
+        self._link_lost.set()
+        self._connected = asyncio.Event()
+        self._listeners: list[Callable[[bool], None]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the serial port is open and the amp answers."""
+        return self._monoprice is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the supervisor and request worker in the background."""
+        self._tasks = [
+            self._hass.async_create_background_task(
+                self._async_supervise(), f"monoprice supervisor {self.port}"
+            ),
+            self._hass.async_create_background_task(
+                self._async_run(), f"monoprice bus {self.port}"
+            ),
+        ]
+
+    async def async_wait_connected(self) -> None:
+        """Wait until the port has been opened and the hardware identified."""
+        await self._connected.wait()
+
+    async def async_shutdown(self) -> None:
+        """Stop the bus, close the port and fail any request still waiting."""
+        self._shutdown = True
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        while not self._queue.empty():
+            *_, future, _ = self._queue.get_nowait()
+            if future is not None and not future.done():
+                future.cancel()
+        for _, futures in self._pending.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._pending.clear()
+        monoprice = self._monoprice
+        self._monoprice = None
+        # the worker runs one job at a time, so this runs after any open in progress
+        await self._hass.loop.run_in_executor(self._executor, self._close_ports, monoprice)
+        self._executor.shutdown(wait=False)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[bool], None]) -> CALLBACK_TYPE:
+        """Call listener with the new state whenever the link goes up or down."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    async def async_call(self, priority: int, method: str, *args: Any) -> Any:
+        """Queue a pymonoprice call and wait for its result.
+
+        Lower priority values run first; requests of equal priority run in
+        the order they were submitted.
+        """
+        if not self.connected:
+            raise SerialException(f"Monoprice controller at {self.port} is not connected")
+        future = self._hass.loop.create_future()
+        self._queue.put_nowait(
+            (priority, next(self._sequence), method, args, future, None)
+        )
+        return await future
+
+    async def async_command(self, method: str, zone_id: int, *args: Any) -> bool:
+        """Send a setting to a zone, keeping only the newest value per setting.
+
+        If the same setting is changed again before it reaches the amp, only
+        the latest value is sent. While the link is down the command is held
+        and replayed after reconnecting instead of failing.
+
+        Returns True once the amp has acknowledged the setting, or False if it
+        could not be sent now (including when it is held for replay).
+        """
+        key = (method, zone_id)
+        future = self._hass.loop.create_future()
+        if (entry := self._pending.get(key)) is not None:
+            entry[0] = args
+            entry[1].append(future)
+        else:
+            self._pending[key] = [args, [future]]
+            if self.connected:
+                self._enqueue_command(key)
+        if not self.connected:
+            return False
+        return await future
+
+    @callback
+    def _enqueue_command(self, key: tuple[str, int]) -> None:
+        """Schedule the pending command for key to be sent."""
+        self._queue.put_nowait(
+            (PRIORITY_COMMAND, next(self._sequence), key[0], None, None, key)
+        )
+
+    async def _async_run(self) -> None:
+        """Process queued requests one at a time on the port's own thread."""
+        while True:
+            _, _, method, args, future, key = await self._queue.get()
+            if key is not None:
+                await self._async_send_command(key)
+                continue
+            if future.done():
+                continue
+            if not self.connected:
+                future.set_exception(
+                    SerialException(f"Monoprice controller at {self.port} is not connected")
+                )
+                continue
+            try:
+                result = await self._async_execute(method, *args)
+            except Exception as err:  # pylint: disable=broad-except
+                if not future.done():
+                    future.set_exception(err)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _async_send_command(self, key: tuple[str, int]) -> None:
+        """Send the newest value of a pending command."""
+        if (entry := self._pending.get(key)) is None:
+            return
+        if not self.connected:
+            # held for replay; callers need not wait for the reconnect
+            _resolve(entry[1], False)
+            entry[1] = []
+            return
+        args, futures = self._pending.pop(key)
+        method, zone_id = key
+        try:
+            await self._async_execute(method, zone_id, *args)
+        except Exception as err:  # pylint: disable=broad-except
+            if _is_link_error(err) and key not in self._pending:
+                # keep the command so it is replayed once the port is back
+                self._pending[key] = [args, []]
+            else:
+                _LOGGER.warning(
+                    "Could not send %s to zone %d: %s", method, zone_id, err
+                )
+            _resolve(futures, False)
+        else:
+            _resolve(futures, True)
+
+    async def _async_execute(self, method: str, *args: Any) -> Any:
+        """Run a pymonoprice method, dropping the link if the port has failed."""
+        monoprice = self._monoprice
+        try:
+            return await self._hass.loop.run_in_executor(
+                self._executor, self._paced_call, monoprice, method, args
+            )
+        except Exception as err:
+            if _is_link_error(err) and self._monoprice is monoprice:
+                self._async_link_lost(err)
+            raise
+
+    def _open_port(self):
+        """Open the port unless the bus is shutting down; runs in the worker thread."""
+        monoprice, units = _open(self.port)
+        if self._shutdown:
+            _close(monoprice)
+            raise SerialException(f"Monoprice bus for {self.port} is shut down")
+        self._opened = monoprice
+        return monoprice, units
+
+    def _close_ports(self, monoprice) -> None:
+        """Close the active port and any port opened during shutdown."""
+        for opened in (monoprice, self._opened):
+            if opened is not None:
+                _close(opened)
+        self._opened = None
+
+    def _paced_call(self, monoprice, method: str, args: tuple) -> Any:
+        """Run a pymonoprice method with the unit's pacing; called from the worker thread."""
+        zone_id = args[0] if isinstance(args[0], int) else args[0].zone
+        pacing = self.pacing[zone_id // 10]
+        # only polled units are queried, so a query timeout is a dropped request
+        # like any other; it is not retried because the next poll reads it again
+        attempts = 1 if method == "zone_status" else 2
+        # restore_zone sends a command per setting, so its total time says
+        # nothing about the unit's reply time to a single request
+        sampled = method not in MULTI_REQUEST_METHODS
+        for attempt in range(attempts):
+            if (wait := pacing.gap - (time.monotonic() - self._last_request)) > 0:
+                time.sleep(wait)
+            timeout = pacing.timeout
+            _set_timeout(monoprice, timeout)
+            started = time.monotonic()
+            try:
+                result = getattr(monoprice, method)(*args)
+            except SerialTimeoutException:
+                pacing.record_timeout(timeout)
+                if attempt == attempts - 1:
+                    raise
+                _LOGGER.debug("No reply to %s for zone %d, sending again", method, zone_id)
+            else:
+                if sampled:
+                    pacing.record_reply(time.monotonic() - started)
+                return result
+            finally:
+                self._last_request = time.monotonic()
+
+    @callback
+    def _async_link_lost(self, err: Exception) -> None:
+        """Mark the link as dead and let the supervisor reopen it."""
+        _LOGGER.warning(
+            "Lost connection to Monoprice controller at %s: %s", self.port, err
+        )
+        monoprice = self._monoprice
+        self._monoprice = None
+        self._connected.clear()
+        self._link_lost.set()
+        self._hass.loop.run_in_executor(self._executor, _close, monoprice)
+        self._async_notify(False)
+
+    async def _async_supervise(self) -> None:
+        """Open the port and reopen it with back-off whenever it is lost."""
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            await self._link_lost.wait()
+            try:
+                monoprice, units = await self._hass.loop.run_in_executor(
+                    self._executor, self._open_port
+                )
+            except (SerialException, OSError) as err:
+                _LOGGER.debug(
+                    "Could not connect to Monoprice controller at %s, retrying in %ds: %s",
+                    self.port,
+                    delay,
+                    err,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                continue
+
+            delay = RECONNECT_MIN_DELAY
+            self._opened = None
+            self._monoprice = monoprice
+            self.units = units
+            self._link_lost.clear()
+            self._connected.set()
+            _LOGGER.info(
+                "Connected to Monoprice controller at %s, units %s",
+                self.port,
+                sorted(units),
+            )
+            for key in list(self._pending):
+                if key[1] // 10 in units:
+                    self._enqueue_command(key)
+                else:
+                    self._pending.pop(key)
+            self._async_notify(True)
+
+    @callback
+    def _async_notify(self, connected: bool) -> None:
+        """Tell listeners the link went up or down."""
+        for listener in list(self._listeners):
+            listener(connected)
+
+
+def _open(port: str):
+    """Open the port and find out which units answer; runs in the worker thread."""
+    monoprice = get_monoprice(port)
+    units = set()
+    for unit in UNITS:
+        try:
+            status = monoprice.zone_status((unit * 10) + 1)
+        except SerialTimeoutException:
+            status = None
+        except SerialException:
+            _close(monoprice)
+            raise
+        if status is not None:
+            units.add(unit)
+        elif unit == 1:
+            # the master unit always exists, so no answer means no amp
+            _close(monoprice)
+            raise SerialException(f"No response from Monoprice controller at {port}")
+    return monoprice, units
+
+
+def _resolve(futures: list[asyncio.Future], sent: bool) -> None:
+    """Tell callers waiting on a command whether it reached the amp."""
+    for future in futures:
+        if not future.done():
+            future.set_result(sent)
+
+
+def _set_timeout(monoprice, timeout: float) -> None:
+    """Change the read timeout of the serial port held by a pymonoprice object."""
+    port = getattr(monoprice, "_port", None)
+    if port is not None and port.timeout != timeout:
+        port.timeout = timeout
+
+
+def _close(monoprice) -> None:
+    """Close the serial port held by a pymonoprice object."""
+    if (port := getattr(monoprice, "_port", None)) is not None:
+        try:
+            port.close()
+        except (OSError, SerialException):
+            pass
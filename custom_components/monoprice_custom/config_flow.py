@@ -9,6 +9,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries, core, exceptions
 from homeassistant.const import CONF_PORT
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     CONF_SOURCE_1,
@@ -18,6 +19,7 @@ from .const import (
     CONF_SOURCE_5,
     CONF_SOURCE_6,
     CONF_SOURCES,
+    CONF_TCP_PORT,
     DOMAIN,
 )
 
@@ -129,9 +131,10 @@ class MonopriceOptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(self, user_input=None):
         """Manage the options."""
         if user_input is not None:
-            return self.async_create_entry(
-                title="", data={CONF_SOURCES: _sources_from_config(user_input)}
-            )
+            data = {CONF_SOURCES: _sources_from_config(user_input)}
+            if user_input.get(CONF_TCP_PORT):
+                data[CONF_TCP_PORT] = user_input[CONF_TCP_PORT]
+            return self.async_create_entry(title="", data=data)
 
         previous_sources = self._previous_sources()
 
@@ -139,6 +142,14 @@ class MonopriceOptionsFlowHandler(config_entries.OptionsFlow):
             _key_for_source(idx + 1, source, previous_sources): str
             for idx, source in enumerate(SOURCES)
         }
+        if CONF_TCP_PORT in self.config_entry.options:
+            tcp_port_key = vol.Optional(
+                CONF_TCP_PORT,
+                description={"suggested_value": self.config_entry.options[CONF_TCP_PORT]},
+            )
+        else:
+            tcp_port_key = vol.Optional(CONF_TCP_PORT)
+        options[tcp_port_key] = cv.port
 
         return self.async_show_form(
             step_id="init",
@@ -12,6 +12,7 @@ CONF_SOURCE_5 = "source_5"
 CONF_SOURCE_6 = "source_6"
 
 CONF_NOT_FIRST_RUN = "not_first_run"
+CONF_TCP_PORT = "tcp_port"
 
 SERVICE_SNAPSHOT = "snapshot"
 SERVICE_RESTORE = "restore"
@@ -19,8 +20,11 @@ SERVICE_SET_BALANCE = "set_balance"
 SERVICE_SET_BASS = "set_bass"
 SERVICE_SET_TREBLE = "set_treble"
 
-FIRST_RUN = "first_run"
-MONOPRICE_OBJECT = "monoprice_object"
+MONOPRICE_BUS = "monoprice_bus"
+MONOPRICE_COORDINATOR = "monoprice_coordinator"
+MONOPRICE_MULTIPLEXER = "monoprice_multiplexer"
+MONOPRICE_USAGE = "monoprice_usage"
+ENTRY_OPTIONS = "entry_options"
 UNDO_UPDATE_LISTENER = "update_update_listener"
 
 ATTR_BALANCE = "level"
@@ -0,0 +1,157 @@
+"""Zone status coordinator for the Monoprice 6-Zone Amplifier integration."""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+import logging
+import time
+
+from pymonoprice import ZoneStatus
+from serial import SerialException
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .aggregates import ZoneAggregates
+from .bus import PRIORITY_COMMAND, PRIORITY_POLL, MonopriceBus
+from .const import DOMAIN
+from .usage import ZoneUsage
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(seconds=10)
+
+ZONES = [(unit * 10) + zone for unit in range(1, 4) for zone in range(1, 7)]
+
+
+class MonopriceCoordinator(DataUpdateCoordinator[dict[int, ZoneStatus | None]]):
+    """Poll the zones of one amplifier stack and share the result."""
+
+    def __init__(self, hass: HomeAssistant, bus: MonopriceBus, usage: ZoneUsage) -> None:
+        """Initialize the coordinator for a bus."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {bus.port}",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.bus = bus
+        self.usage = usage
+        self.data = {}
+        self.aggregates = ZoneAggregates()
+        # zone_id -> time.monotonic() when its entry in data was read
+        self.updated: dict[int, float] = {}
+        # units that answered at the previous connect
+        self._units: set[int] = set()
+        bus.async_add_listener(self._async_connection_changed)
+        # zone_id -> number of entities currently interested in the zone
+        self._zones: Counter[int] = Counter()
+
+    @callback
+    def async_track_zone(self, zone_id: int) -> CALLBACK_TYPE:
+        """Include a zone in polling for as long as an entity needs it."""
+        self._zones[zone_id] += 1
+
+        @callback
+        def _untrack() -> None:
+            self._zones[zone_id] -= 1
+            if self._zones[zone_id] <= 0:
+                del self._zones[zone_id]
+
+        return _untrack
+
+    def zones_counted(self, unit: int | None = None) -> bool:
+        """Return True once the aggregates include every tracked zone.
+
+        Only zones of units that answered at connect are considered, or only
+        those of one unit if given.
+        """
+        if not self.bus.units:
+            return False
+        zones = [
+            zone_id
+            for zone_id in self._zones
+            if zone_id in ZONES
+            and zone_id // 10 in self.bus.units
+            and (unit is None or zone_id // 10 == unit)
+        ]
+        return self.aggregates.counted(zones)
+
+    @callback
+    def _async_connection_changed(self, connected: bool) -> None:
+        """Mark entities unavailable on link loss and refresh once it is back."""
+        if connected:
+            if removed := self._units - self.bus.units:
+                self._async_remove_units(removed)
+            self._units = set(self.bus.units)
+            self.hass.async_create_background_task(
+                self.async_refresh(), f"monoprice refresh {self.bus.port}"
+            )
+        else:
+            self.async_set_update_error(
+                SerialException(f"Lost connection to Monoprice controller at {self.bus.port}")
+            )
+
+    @callback
+    def _async_remove_units(self, units: set[int]) -> None:
+        """Forget the zones of units that no longer answer after a reconnect."""
+        _LOGGER.warning(
+            "Monoprice units %s at %s no longer answer", sorted(units), self.bus.port
+        )
+        data = dict(self.data)
+        for zone_id in ZONES:
+            if zone_id // 10 in units:
+                data[zone_id] = None
+                self.aggregates.remove(zone_id)
+                self.updated.pop(zone_id, None)
+        self.async_set_updated_data(data)
+
+    async def async_refresh_zone(self, zone_id: int) -> None:
+        """Fetch a single zone ahead of regular polling, e.g. after a command."""
+        if not self.bus.connected:
+            return
+        if (status := await self._async_zone_status(zone_id, PRIORITY_COMMAND)) is None:
+            return
+        self.aggregates.update(zone_id, status)
+        self.usage.update(zone_id, status)
+        self.updated[zone_id] = time.monotonic()
+        self.async_set_updated_data({**self.data, zone_id: status})
+
+    async def _async_update_data(self) -> dict[int, ZoneStatus | None]:
+        """Fetch the status of every tracked zone."""
+        if not self.bus.connected:
+            raise UpdateFailed(f"Monoprice controller at {self.bus.port} is not connected")
+
+        # zones of expansion units that did not answer at connect are skipped
+        zones = [zone_id for zone_id in sorted(self._zones) if zone_id // 10 in self.bus.units]
+        # zone_id -> (status, time.monotonic() when it was read)
+        polled = {}
+        for zone_id in zones:
+            status = await self._async_zone_status(zone_id, PRIORITY_POLL)
+            polled[zone_id] = (status, time.monotonic())
+            self.aggregates.update(zone_id, status)
+            self.usage.update(zone_id, status)
+            if not self.bus.connected:
+                raise UpdateFailed(f"Lost connection to Monoprice controller at {self.bus.port}")
+
+        if zones and all(status is None for status, _ in polled.values()):
+            raise UpdateFailed(f"No response from Monoprice controller at {self.bus.port}")
+
+        # merge into the current table: async_refresh_zone may have stored a
+        # newer reading for a zone after this poll read it
+        data = dict(self.data)
+        for zone_id, (status, read_at) in polled.items():
+            if self.updated.get(zone_id, 0) > read_at:
+                continue
+            data[zone_id] = status
+            if status is not None:
+                self.updated[zone_id] = read_at
+        return data
+
+    async def _async_zone_status(self, zone_id: int, priority: int) -> ZoneStatus | None:
+        """Query one zone, returning None if it does not answer."""
+        try:
+            return await self.bus.async_call(priority, "zone_status", zone_id)
+        except SerialException:
+            _LOGGER.warning("Could not update zone %d", zone_id)
+            return None
@@ -0,0 +1,99 @@
+"""Base entity for the Monoprice 6-Zone Amplifier integration."""
+from __future__ import annotations
+
+from pymonoprice import ZoneStatus
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import MonopriceCoordinator
+
+
+class MonopriceStackEntity(CoordinatorEntity[MonopriceCoordinator]):
+    """Common behaviour for entities describing a whole amplifier stack."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: MonopriceCoordinator, namespace, name):
+        """Initialize the stack entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, namespace)},
+            manufacturer="Monoprice",
+            model="6-Zone Amplifier",
+            name=name,
+        )
+
+
+class MonopriceZoneDeviceEntity(CoordinatorEntity[MonopriceCoordinator]):
+    """Common behaviour for entities shown on an amplifier zone's device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: MonopriceCoordinator, namespace, zone_id):
+        """Initialize the zone entity."""
+        super().__init__(coordinator)
+        self._zone_id = zone_id
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{namespace}_{self._zone_id}")},
+            manufacturer="Monoprice",
+            model="6-Zone Amplifier",
+            name=f"Zone {self._zone_id}",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start polling this zone once the entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_zone(self._zone_id))
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return if the entity should be enabled when first added to the entity registry."""
+        if(self._zone_id == 10 or self._zone_id == 20 or self._zone_id == 30):
+            return False
+        return True
+
+
+class MonopriceZoneEntity(MonopriceZoneDeviceEntity):
+    """Common behaviour for entities backed by a single amplifier zone's status."""
+
+    async def async_added_to_hass(self) -> None:
+        """Show the zone's status, or the last known state until it is read."""
+        await super().async_added_to_hass()
+        if (state := self.zone_status) is not None:
+            self._update_from_status(state)
+        else:
+            await self._async_restore_last_state()
+
+    @property
+    def available(self) -> bool:
+        """Return False once the zone's unit stopped answering at connect."""
+        # units are empty until the first connect, when the state is restored
+        units = self.coordinator.bus.units
+        return super().available and (not units or self._zone_id // 10 in units)
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state is restored rather than read from the amp."""
+        return self.zone_status is None
+
+    @property
+    def zone_status(self) -> ZoneStatus | None:
+        """Return the latest status of this zone, if it answered."""
+        return self.coordinator.data.get(self._zone_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes from the latest zone status."""
+        if (state := self.zone_status) is not None:
+            self._update_from_status(state)
+        super()._handle_coordinator_update()
+
+    def _update_from_status(self, state: ZoneStatus) -> None:
+        """Copy the relevant fields of a zone status onto the entity."""
+        raise NotImplementedError
+
+    async def _async_restore_last_state(self) -> None:
+        """Show the last known state until the amp has been queried."""
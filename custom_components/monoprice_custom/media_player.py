@@ -1,10 +1,14 @@
 """Support for interfacing with Monoprice 6 zone home audio controller."""
 import logging
 
-from serial import SerialException
+from pymonoprice import ZoneStatus
 
 from homeassistant import core
 from homeassistant.components.media_player import (
+    ATTR_INPUT_SOURCE,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
+    ATTR_SOUND_MODE,
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
@@ -14,16 +18,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, entity_platform, service
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 import voluptuous as vol
 
+from .bus import PRIORITY_COMMAND
 from .const import (
-    CONF_NAME,
     CONF_SOURCES,
     DOMAIN,
-    FIRST_RUN,
-    MONOPRICE_OBJECT,
+    MONOPRICE_COORDINATOR,
     SERVICE_RESTORE,
     SERVICE_SNAPSHOT,
     SERVICE_SET_BALANCE,
@@ -33,6 +36,8 @@ from .const import (
     ATTR_BASS,
     ATTR_TREBLE
 )
+from .coordinator import ZONES
+from .entity import MonopriceZoneEntity
 
 SET_BALANCE_SCHEMA = vol.Schema(
     {
@@ -58,7 +63,7 @@ SET_TREBLE_SCHEMA = vol.Schema(
 _LOGGER = logging.getLogger(__name__)
 
 MAX_VOLUME = 38
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 
 @core.callback
@@ -88,37 +93,33 @@ async def async_setup_entry(
     """Set up the Monoprice 6-zone amplifier platform."""
     port = config_entry.data[CONF_PORT]
 
-    monoprice = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_OBJECT]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_COORDINATOR]
 
     sources = _get_sources(config_entry)
 
     entities = []
-    for i in range(1, 4):
-        for j in range(1, 7):
-            zone_id = (i * 10) + j
-            _LOGGER.info("Adding zone %d for port %s", zone_id, port)
-            entities.append(
-                MonopriceZone(monoprice, sources, config_entry.entry_id, zone_id)
-            )
-
-    # only call update before add if it's the first run so we can try to detect zones
-    first_run = hass.data[DOMAIN][config_entry.entry_id][FIRST_RUN]
-    async_add_entities(entities, first_run)
+    for zone_id in ZONES:
+        _LOGGER.info("Adding zone %d for port %s", zone_id, port)
+        entities.append(
+            MonopriceZone(coordinator, sources, config_entry.entry_id, zone_id)
+        )
+
+    async_add_entities(entities)
 
     platform = entity_platform.async_get_current_platform()
 
-    def _call_service(entities, service_call):
+    async def _async_call_service(entities, service_call):
         for entity in entities:
             if service_call.service == SERVICE_SNAPSHOT:
-                entity.snapshot()
+                await entity.async_snapshot()
             elif service_call.service == SERVICE_RESTORE:
-                entity.restore()
+                await entity.async_restore()
             elif service_call.service == SERVICE_SET_BALANCE:
-                entity.set_balance(service_call)
+                await entity.async_set_balance(service_call)
             elif service_call.service == SERVICE_SET_BASS:
-                entity.set_bass(service_call)
+                await entity.async_set_bass(service_call)
             elif service_call.service == SERVICE_SET_TREBLE:
-                entity.set_treble(service_call)
+                await entity.async_set_treble(service_call)
 
     @service.verify_domain_control(DOMAIN)
     async def async_service_handle(service_call: core.ServiceCall) -> None:
@@ -128,7 +129,7 @@ async def async_setup_entry(
         if not entities:
             return
 
-        hass.async_add_executor_job(_call_service, entities, service_call)
+        await _async_call_service(entities, service_call)
 
     hass.services.async_register(
         DOMAIN,
@@ -165,7 +166,7 @@ async def async_setup_entry(
         schema=SET_TREBLE_SCHEMA,
     )
 
-class MonopriceZone(MediaPlayerEntity):
+class MonopriceZone(MonopriceZoneEntity, RestoreEntity, MediaPlayerEntity):
     """Representation of a Monoprice amplifier zone."""
     
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
@@ -178,14 +179,14 @@ class MonopriceZone(MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
         | MediaPlayerEntityFeature.SELECT_SOUND_MODE
     )
-    _attr_has_entity_name = True
     _attr_name = None
     _attr_sound_mode_list = ["Normal", "High Bass", "Medium Bass", "Low Bass"]
     _attr_sound_mode = None
 
-    def __init__(self, monoprice, sources, namespace, zone_id):
+    def __init__(self, coordinator, sources, namespace, zone_id):
         """Initialize new zone."""
-        self._monoprice = monoprice
+        super().__init__(coordinator, namespace, zone_id)
+        self._bus = coordinator.bus
         # dict source_id -> source name
         self._source_id_name = sources[0]
         # dict source name -> source_id
@@ -193,120 +194,111 @@ class MonopriceZone(MediaPlayerEntity):
         # ordered list of all source names
         self._attr_source_list = sources[2]
 
-        self._zone_id = zone_id
         self._attr_unique_id = f"{namespace}_{self._zone_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{namespace}_{self._zone_id}")},
-            manufacturer="Monoprice",
-            model="6-Zone Amplifier",
-            name=f"Zone {self._zone_id}",
-        )
-        
+
         self._snapshot = None
-        self._update_success = True
-        
 
-    def update(self) -> None:
+    def _update_from_status(self, state: ZoneStatus) -> None:
         """Retrieve latest state."""
-        try:
-            state = self._monoprice.zone_status(self._zone_id)
-        except SerialException:
-            self._update_success = False
-            _LOGGER.warning("Could not update zone %d", self._zone_id)
-            return
-
-        if not state:
-            self._update_success = False
-            return
-
         self._attr_state = MediaPlayerState.ON if state.power else MediaPlayerState.OFF
         self._attr_volume_level = state.volume / MAX_VOLUME
         self._attr_is_volume_muted = state.mute
         idx = state.source
         self._attr_source = self._source_id_name.get(idx)
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added to the entity registry."""
-        if(self._zone_id == 10 or self._zone_id == 20 or self._zone_id == 30):
-            return False
-        return self._zone_id < 20 or self._update_success
+    async def _async_restore_last_state(self) -> None:
+        """Show the last known state until the amp has been queried."""
+        if (last_state := await self.async_get_last_state()) is None:
+            return
+        if last_state.state in (MediaPlayerState.ON, MediaPlayerState.OFF):
+            self._attr_state = MediaPlayerState(last_state.state)
+        self._attr_volume_level = last_state.attributes.get(ATTR_MEDIA_VOLUME_LEVEL)
+        self._attr_is_volume_muted = last_state.attributes.get(ATTR_MEDIA_VOLUME_MUTED)
+        self._attr_source = last_state.attributes.get(ATTR_INPUT_SOURCE)
+        self._attr_sound_mode = last_state.attributes.get(ATTR_SOUND_MODE)
 
     @property
     def media_title(self):
         """Return the current source as medial title."""
         return self.source
 
-    def snapshot(self):
+    async def _async_command(self, method, *args) -> None:
+        """Send a command for this zone and refresh its state."""
+        await self._bus.async_command(method, self._zone_id, *args)
+        await self.coordinator.async_refresh_zone(self._zone_id)
+
+    async def async_snapshot(self):
         """Save zone's current state."""
-        self._snapshot = self._monoprice.zone_status(self._zone_id)
+        self._snapshot = await self._bus.async_call(
+            PRIORITY_COMMAND, "zone_status", self._zone_id
+        )
 
-    def restore(self):
+    async def async_restore(self):
         """Restore saved state."""
         if self._snapshot:
-            self._monoprice.restore_zone(self._snapshot)
-            self.schedule_update_ha_state(True)
+            await self._bus.async_call(PRIORITY_COMMAND, "restore_zone", self._snapshot)
+            await self.coordinator.async_refresh_zone(self._zone_id)
 
-    def select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> None:
         """Set input source."""
         if source not in self._source_name_id:
             return
         idx = self._source_name_id[source]
-        self._monoprice.set_source(self._zone_id, idx)
+        await self._async_command("set_source", idx)
 
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        self._monoprice.set_power(self._zone_id, True)
+        await self._async_command("set_power", True)
 
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the media player off."""
-        self._monoprice.set_power(self._zone_id, False)
+        await self._async_command("set_power", False)
 
-    def mute_volume(self, mute: bool) -> None:
+    async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-        self._monoprice.set_mute(self._zone_id, mute)
+        await self._async_command("set_mute", mute)
 
-    def set_volume_level(self, volume: float) -> None:
+    async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        self._monoprice.set_volume(self._zone_id, round(volume * MAX_VOLUME))
+        await self._async_command("set_volume", round(volume * MAX_VOLUME))
 
-    def volume_up(self) -> None:
+    async def async_volume_up(self) -> None:
         """Volume up the media player."""
         if self.volume_level is None:
             return
         volume = round(self.volume_level * MAX_VOLUME)
-        self._monoprice.set_volume(self._zone_id, min(volume + 1, MAX_VOLUME))
+        await self._async_command("set_volume", min(volume + 1, MAX_VOLUME))
 
-    def volume_down(self) -> None:
+    async def async_volume_down(self) -> None:
         """Volume down media player."""
         if self.volume_level is None:
             return
         volume = round(self.volume_level * MAX_VOLUME)
-        self._monoprice.set_volume(self._zone_id, max(volume - 1, 0))
+        await self._async_command("set_volume", max(volume - 1, 0))
 
-    def set_balance(self, call) -> None:
+    async def async_set_balance(self, call) -> None:
         """Set balance level."""
         level = int(call.data.get(ATTR_BALANCE))
-        self._monoprice.set_balance(self._zone_id, level)
+        await self._async_command("set_balance", level)
  
-    def set_bass(self, call) -> None:
+    async def async_set_bass(self, call) -> None:
         """Set bass level."""
         level = int(call.data.get(ATTR_BASS))
-        self._monoprice.set_bass(self._zone_id, level)
+        await self._async_command("set_bass", level)
 
-    def set_treble(self, call) -> None:
+    async def async_set_treble(self, call) -> None:
         """Set treble level."""
         level = int(call.data.get(ATTR_TREBLE))
-        self._monoprice.set_treble(self._zone_id, level)
+        await self._async_command("set_treble", level)
 
-    def select_sound_mode(self, sound_mode) -> None:
+    async def async_select_sound_mode(self, sound_mode) -> None:
         """Switch the sound mode of the entity."""
-        self._sound_mode = sound_mode
+        self._attr_sound_mode = sound_mode
         if(sound_mode == "Normal"):
-            self._monoprice.set_bass(self._zone_id, 7)
+            await self._async_command("set_bass", 7)
         elif(sound_mode == "High Bass"):
-            self._monoprice.set_bass(self._zone_id, 12)
+            await self._async_command("set_bass", 12)
         elif(sound_mode == "Medium Bass"):
-            self._monoprice.set_bass(self._zone_id, 10)
+            await self._async_command("set_bass", 10)
         elif(sound_mode == "Low Bass"):
-            self._monoprice.set_bass(self._zone_id, 3)
+            await self._async_command("set_bass", 3)
@@ -0,0 +1,166 @@
+"""Local TCP endpoint sharing the amplifier with other tools."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from pymonoprice import ZoneStatus
+
+from .coordinator import MonopriceCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TCP_HOST = "127.0.0.1"
+
+# status replies older than this are fetched from the amp again
+STATUS_MAX_AGE = 5
+
+COMMAND_ERROR = b"\r\nCommand Error.\r\n#"
+
+# two letter command code -> (pymonoprice method, value converter)
+COMMANDS = {
+    "PR": ("set_power", bool),
+    "MU": ("set_mute", bool),
+    "VO": ("set_volume", int),
+    "TR": ("set_treble", int),
+    "BS": ("set_bass", int),
+    "BL": ("set_balance", int),
+    "CH": ("set_source", int),
+}
+
+
+def _format_status(status: ZoneStatus) -> str:
+    """Format a zone status the way the amp reports it."""
+    fields = (
+        status.zone,
+        status.pa,
+        status.power,
+        status.mute,
+        status.do_not_disturb,
+        status.volume,
+        status.treble,
+        status.bass,
+        status.balance,
+        status.source,
+        status.keypad,
+    )
+    return ">" + "".join(f"{int(field):02d}" for field in fields)
+
+
+class MonopriceMultiplexer:
+    """Speak the amp's text protocol on a local TCP port.
+
+    External clients never touch the serial port: their commands go through
+    the same bus queue as Home Assistant's, status queries are answered from
+    the coordinator's zone table when it is recent enough, and every change
+    they make is pushed to the entities straight away.
+    """
+
+    def __init__(self, coordinator: MonopriceCoordinator) -> None:
+        """Initialize the multiplexer for a coordinator."""
+        self._coordinator = coordinator
+        self._server: asyncio.AbstractServer | None = None
+        # handler tasks of connected clients
+        self._clients: set[asyncio.Task] = set()
+
+    async def async_start(self, port: int) -> None:
+        """Start listening for clients."""
+        self._server = await asyncio.start_server(self._async_handle_client, TCP_HOST, port)
+        _LOGGER.info(
+            "Sharing Monoprice controller at %s on %s:%d",
+            self._coordinator.bus.port,
+            TCP_HOST,
+            port,
+        )
+
+    async def async_stop(self) -> None:
+        """Stop listening and disconnect clients."""
+        if self._server is not None:
+            self._server.close()
+            # wait_closed() waits for open connections, so end them first
+            for client in self._clients:
+                client.cancel()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _async_handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests from one client until it disconnects."""
+        task = asyncio.current_task()
+        self._clients.add(task)
+        try:
+            while line := await reader.readuntil(b"\r"):
+                request = line.decode("ascii", errors="replace").strip()
+                if not request:
+                    continue
+                writer.write(await self._async_handle_request(request))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.LimitOverrunError:
+            _LOGGER.debug("Dropping client sending oversized requests")
+        except asyncio.CancelledError:
+            # the multiplexer is stopping
+            pass
+        finally:
+            self._clients.discard(task)
+            writer.close()
+
+    async def _async_handle_request(self, request: str) -> bytes:
+        """Run one request and return the reply the amp would give."""
+        if not self._coordinator.bus.connected:
+            return COMMAND_ERROR
+        try:
+            zone_id = int(request[1:3])
+        except ValueError:
+            return COMMAND_ERROR
+        if zone_id % 10 > 6:
+            return COMMAND_ERROR
+        # zone x0 addresses every zone of unit x
+        if zone_id % 10 == 0:
+            zones = [zone_id + zone for zone in range(1, 7)]
+        else:
+            zones = [zone_id]
+        if zones[0] // 10 not in self._coordinator.bus.units:
+            return COMMAND_ERROR
+
+        if request[0] == "?" and len(request) == 3:
+            statuses = [await self._async_zone_status(zone) for zone in zones]
+            if any(status is None for status in statuses):
+                return COMMAND_ERROR
+            reply = "".join(f"#{_format_status(status)}\r\r\n" for status in statuses)
+            return f"{request}\r\r\n{reply}#".encode("ascii")
+
+        if request[0] == "<" and len(request) == 7 and request[3:5] in COMMANDS:
+            method, convert = COMMANDS[request[3:5]]
+            try:
+                value = convert(int(request[5:7]))
+            except ValueError:
+                return COMMAND_ERROR
+            # a write that timed out or is held for replay is not acknowledged
+            if not await self._coordinator.bus.async_command(method, zone_id, value):
+                return COMMAND_ERROR
+            for zone in zones:
+                await self._coordinator.async_refresh_zone(zone)
+            return f"{request}\r\r\n#".encode("ascii")
+
+        return COMMAND_ERROR
+
+    async def _async_zone_status(self, zone_id: int) -> ZoneStatus | None:
+        """Return a zone's status, from the zone table if it is recent enough.
+
+        Returns None if the zone could not be read within STATUS_MAX_AGE.
+        """
+        if not self._is_fresh(zone_id):
+            await self._coordinator.async_refresh_zone(zone_id)
+            if not self._is_fresh(zone_id):
+                return None
+        return self._coordinator.data.get(zone_id)
+
+    def _is_fresh(self, zone_id: int) -> bool:
+        """Return True if the zone was read less than STATUS_MAX_AGE ago."""
+        updated = self._coordinator.updated.get(zone_id)
+        return updated is not None and time.monotonic() - updated <= STATUS_MAX_AGE
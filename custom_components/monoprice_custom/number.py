@@ -2,31 +2,31 @@
 from code import interact
 import logging
 
-from serial import SerialException
+from pymonoprice import ZoneStatus
 
 from homeassistant import core
 try:
     from homeassistant.components.number import (
-        NumberEntity as NumberEntity,
+        RestoreNumber as RestoreNumber,
     )
 except ImportError:
-    from homeassistant.components.number import NumberEntity
+    from homeassistant.components.number import RestoreNumber
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, entity_platform, service
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
-    FIRST_RUN,
-    MONOPRICE_OBJECT
+    MONOPRICE_COORDINATOR
 )
+from .coordinator import ZONES
+from .entity import MonopriceZoneEntity
 
 _LOGGER = logging.getLogger(__name__)
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,20 +35,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Monoprice 6-zone amplifier platform."""
     port = config_entry.data[CONF_PORT]
-    monoprice = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_OBJECT]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_COORDINATOR]
 
     entities = []
-    for i in range(1, 4):
-        for j in range(1, 7):
-            zone_id = (i * 10) + j
-            _LOGGER.info("Adding number entities for zone %d for port %s", zone_id, port)
-            entities.append(MonopriceZone(monoprice, "Balance", config_entry.entry_id, zone_id))
-            entities.append(MonopriceZone(monoprice, "Bass", config_entry.entry_id, zone_id))
-            entities.append(MonopriceZone(monoprice, "Treble", config_entry.entry_id, zone_id))
-
-    # only call update before add if it's the first run so we can try to detect zones
-    first_run = hass.data[DOMAIN][config_entry.entry_id][FIRST_RUN]
-    async_add_entities(entities, first_run)
+    for zone_id in ZONES:
+        _LOGGER.info("Adding number entities for zone %d for port %s", zone_id, port)
+        entities.append(MonopriceZone(coordinator, "Balance", config_entry.entry_id, zone_id))
+        entities.append(MonopriceZone(coordinator, "Bass", config_entry.entry_id, zone_id))
+        entities.append(MonopriceZone(coordinator, "Treble", config_entry.entry_id, zone_id))
+
+    async_add_entities(entities)
 
     platform = entity_platform.async_get_current_platform()
 
@@ -60,26 +56,18 @@ async def async_setup_entry(
         if not entities:
             return
 
-class MonopriceZone(NumberEntity):
+class MonopriceZone(MonopriceZoneEntity, RestoreNumber):
     """Representation of a Monoprice amplifier zone."""
 
-    def __init__(self, monoprice, control_type, namespace, zone_id):
+    def __init__(self, coordinator, control_type, namespace, zone_id):
         """Initialize new zone controls."""
-        self._monoprice = monoprice
+        super().__init__(coordinator, namespace, zone_id)
         self._control_type = control_type
-        self._zone_id = zone_id
         
         self._attr_unique_id = f"{namespace}_{self._zone_id}_{self._control_type}"
-        self._attr_has_entity_name = True
         self._attr_name = f"{control_type} level"
         self._attr_native_step = 1
         self._attr_native_value = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{namespace}_{self._zone_id}")},
-            manufacturer="Monoprice",
-            model="6-Zone Amplifier",
-            name=f"Zone {self._zone_id}"
-        )
 
         if(control_type == "Balance"):
             self._attr_native_min_value = 0
@@ -93,22 +81,9 @@ class MonopriceZone(NumberEntity):
             self._attr_native_min_value = -7
             self._attr_native_max_value = 14
             self._attr_icon = "mdi:surround-sound"
-            
-        self._update_success = True
-        
-    def update(self):
-        """Retrieve latest value."""
-        try:
-            state = self._monoprice.zone_status(self._zone_id)
-        except SerialException:
-            self._update_success = False
-            _LOGGER.warning("Could not update zone %d", self._zone_id)
-            return
-
-        if not state:
-            self._update_success = False
-            return
 
+    def _update_from_status(self, state: ZoneStatus) -> None:
+        """Retrieve latest value."""
         if(self._control_type == "Balance"):
             self._attr_native_value = state.balance
         elif(self._control_type == "Bass"):
@@ -116,18 +91,18 @@ class MonopriceZone(NumberEntity):
         elif(self._control_type == "Treble"):
             self._attr_native_value = state.treble
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added to the entity registry."""
-        if(self._zone_id == 10 or self._zone_id == 20 or self._zone_id == 30):
-            return False
-        return self._zone_id < 20 or self._update_success
+    async def _async_restore_last_state(self) -> None:
+        """Show the last known value until the amp has been queried."""
+        if (last_data := await self.async_get_last_number_data()) is not None:
+            self._attr_native_value = last_data.native_value
 
-    def set_native_value(self, value: float) -> None:
+    async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         if(self._control_type == "Balance"):
-            self._monoprice.set_balance(self._zone_id, int(value))
+            method = "set_balance"
         elif(self._control_type == "Bass"):
-            self._monoprice.set_bass(self._zone_id, int(value))
+            method = "set_bass"
         elif(self._control_type == "Treble"):
-            self._monoprice.set_treble(self._zone_id, int(value))
+            method = "set_treble"
+        await self.coordinator.bus.async_command(method, self._zone_id, int(value))
+        await self.coordinator.async_refresh_zone(self._zone_id)
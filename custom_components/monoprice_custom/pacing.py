@@ -0,0 +1,75 @@
+"""Request pacing learned from measured reply times."""
+from __future__ import annotations
+
+from collections import deque
+
+# pymonoprice's own read timeout, used until enough replies have been timed
+DEFAULT_TIMEOUT = 2.0
+MIN_TIMEOUT = 0.15
+TIMEOUT_FACTOR = 2.0
+
+DEFAULT_GAP = 0.05
+MIN_GAP = 0.01
+MAX_GAP = 0.5
+GAP_FACTOR = 0.5
+MAX_PENALTY = 8.0
+PENALTY_DECAY = 0.9
+
+SAMPLE_WINDOW = 50
+MIN_SAMPLES = 10
+
+
+class UnitPacing:
+    """Reply timing of one amplifier unit and the limits derived from it.
+
+    The read timeout is a multiple of the 95th percentile reply time, so a
+    missing reply costs little more than a slow one. The gap left before
+    each request scales with the median reply time and is widened every
+    time a command is dropped, then relaxes again as replies keep coming.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with pymonoprice's defaults until replies are timed."""
+        self._samples: deque[float] = deque(maxlen=SAMPLE_WINDOW)
+        self._penalty = 1.0
+        self.drops = 0
+
+    @property
+    def samples(self) -> int:
+        """Return the number of reply times in the window."""
+        return len(self._samples)
+
+    @property
+    def timeout(self) -> float:
+        """Return the read timeout to use for this unit, in seconds."""
+        if len(self._samples) < MIN_SAMPLES:
+            return DEFAULT_TIMEOUT
+        return min(max(self.percentile(95) * TIMEOUT_FACTOR, MIN_TIMEOUT), DEFAULT_TIMEOUT)
+
+    @property
+    def gap(self) -> float:
+        """Return the idle time to leave before a request to this unit, in seconds."""
+        if len(self._samples) < MIN_SAMPLES:
+            base = DEFAULT_GAP
+        else:
+            base = self.percentile(50) * GAP_FACTOR
+        return min(max(base * self._penalty, MIN_GAP), MAX_GAP)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a percentile of the recent reply times, in seconds."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+    def record_reply(self, seconds: float) -> None:
+        """Record the round-trip time of an answered request."""
+        self._samples.append(seconds)
+        self._penalty = max(self._penalty * PENALTY_DECAY, 1.0)
+
+    def record_timeout(self, timeout: float) -> None:
+        """Record a request that got no reply within timeout."""
+        self.drops += 1
+        # the reply took at least this long, so let the window see it
+        self._samples.append(timeout)
+        self._penalty = min(self._penalty * 2, MAX_PENALTY)
@@ -2,31 +2,46 @@
 from code import interact
 import logging
 
-from serial import SerialException
+from pymonoprice import ZoneStatus
 
 from homeassistant import core
 try:
     from homeassistant.components.sensor import (
+        RestoreSensor as RestoreSensor,
+        SensorDeviceClass as SensorDeviceClass,
         SensorEntity as SensorEntity,
+        SensorStateClass as SensorStateClass,
     )
 except ImportError:
-    from homeassistant.components.sensor import SensorEntity
+    from homeassistant.components.sensor import (
+        RestoreSensor,
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_PORT, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, entity_platform, service
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .bus import UNITS
 from .const import (
+    CONF_SOURCES,
     DOMAIN,
-    FIRST_RUN,
-    MONOPRICE_OBJECT
+    MONOPRICE_COORDINATOR
 )
+from .coordinator import ZONES
+from .entity import (
+    MonopriceStackEntity,
+    MonopriceZoneDeviceEntity,
+    MonopriceZoneEntity,
+)
+from .media_player import MAX_VOLUME
 
 _LOGGER = logging.getLogger(__name__)
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,20 +50,38 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Monoprice 6-zone amplifier platform."""
     port = config_entry.data[CONF_PORT]
-    monoprice = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_OBJECT]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][MONOPRICE_COORDINATOR]
 
     entities = []
-    for i in range(1, 4):
-        for j in range(1, 7):
-            zone_id = (i * 10) + j
-            _LOGGER.info("Adding sensor entities for zone %d for port %s", zone_id, port)
-            entities.append(MonopriceZone(monoprice, "Keypad", config_entry.entry_id, zone_id))
-            entities.append(MonopriceZone(monoprice, "Public Anouncement", config_entry.entry_id, zone_id))
-            entities.append(MonopriceZone(monoprice, "Do Not Disturb", config_entry.entry_id, zone_id))
-
-    # only call update before add if it's the first run so we can try to detect zones
-    first_run = hass.data[DOMAIN][config_entry.entry_id][FIRST_RUN]
-    async_add_entities(entities, first_run)
+    for zone_id in ZONES:
+        _LOGGER.info("Adding sensor entities for zone %d for port %s", zone_id, port)
+        entities.append(MonopriceZone(coordinator, "Keypad", config_entry.entry_id, zone_id))
+        entities.append(MonopriceZone(coordinator, "Public Anouncement", config_entry.entry_id, zone_id))
+        entities.append(MonopriceZone(coordinator, "Do Not Disturb", config_entry.entry_id, zone_id))
+
+    if CONF_SOURCES in config_entry.options:
+        sources = config_entry.options[CONF_SOURCES]
+    else:
+        sources = config_entry.data[CONF_SOURCES]
+
+    for zone_id in ZONES:
+        entities.append(MonopriceZoneUsageSensor(coordinator, "On time", config_entry.entry_id, zone_id, sources))
+        entities.append(MonopriceZoneUsageSensor(coordinator, "Volume time", config_entry.entry_id, zone_id, sources))
+        for source_id, source_name in sources.items():
+            entities.append(MonopriceZoneSourceUsageSensor(coordinator, config_entry.entry_id, zone_id, int(source_id), source_name))
+
+    namespace = config_entry.entry_id
+    name = f"Monoprice {config_entry.title}"
+    entities.append(MonopriceZonesOnSensor(coordinator, namespace, name, sources))
+    for source_id, source_name in sources.items():
+        entities.append(
+            MonopriceSourceSensor(coordinator, namespace, name, int(source_id), source_name)
+        )
+    for unit in UNITS:
+        entities.append(MonopriceUnitPowerSensor(coordinator, namespace, name, unit))
+        entities.append(MonopriceUnitReplyTimeSensor(coordinator, namespace, name, unit))
+
+    async_add_entities(entities)
 
     platform = entity_platform.async_get_current_platform()
 
@@ -60,24 +93,16 @@ async def async_setup_entry(
         if not entities:
             return
 
-class MonopriceZone(SensorEntity):
+class MonopriceZone(MonopriceZoneEntity, RestoreSensor):
     """Representation of a Monoprice amplifier zone."""
 
-    def __init__(self, monoprice, sensor_type, namespace, zone_id):
+    def __init__(self, coordinator, sensor_type, namespace, zone_id):
         """Initialize new zone sensors."""
-        self._monoprice = monoprice
+        super().__init__(coordinator, namespace, zone_id)
         self._sensor_type = sensor_type
-        self._zone_id = zone_id
         self._attr_unique_id = f"{namespace}_{self._zone_id}_{self._sensor_type}"
-        self._attr_has_entity_name = True
         self._attr_name = f"{sensor_type}"
         self._attr_native_value = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{namespace}_{self._zone_id}")},
-            manufacturer="Monoprice",
-            model="6-Zone Amplifier",
-            name=f"Zone {self._zone_id}"
-        )
 
         if(sensor_type == "Keypad"):
             self._attr_icon = "mdi:dialpad"
@@ -85,22 +110,9 @@ class MonopriceZone(SensorEntity):
             self._attr_icon = "mdi:bullhorn"
         elif(sensor_type == "Do Not Disturb"):
             self._attr_icon = "mdi:weather-night"
-            
-        self._update_success = True
 
-    def update(self):
+    def _update_from_status(self, state: ZoneStatus) -> None:
         """Retrieve latest value."""
-        try:
-            state = self._monoprice.zone_status(self._zone_id)
-        except SerialException:
-            self._update_success = False
-            _LOGGER.warning("Could not update zone %d", self._zone_id)
-            return
-
-        if not state:
-            self._update_success = False
-            return
-
         if(self._sensor_type == "Keypad"):
             self._attr_native_value = '{}'.format('Connected' if state.keypad else 'Disconnected')
         elif(self._sensor_type == "Public Anouncement"):
@@ -108,9 +120,225 @@ class MonopriceZone(SensorEntity):
         elif(self._sensor_type == "Do Not Disturb"):
             self._attr_native_value = '{}'.format('On' if state.do_not_disturb else 'Off')
 
+    async def _async_restore_last_state(self) -> None:
+        """Show the last known value until the amp has been queried."""
+        if (last_data := await self.async_get_last_sensor_data()) is not None:
+            self._attr_native_value = last_data.native_value
+
+
+class MonopriceZoneUsageSensor(MonopriceZoneDeviceEntity, SensorEntity):
+    """Usage statistics of a Monoprice amplifier zone."""
+
+    def __init__(self, coordinator, usage_type, namespace, zone_id, sources):
+        """Initialize new zone usage sensors."""
+        super().__init__(coordinator, namespace, zone_id)
+        self._usage_type = usage_type
+        self._attr_unique_id = f"{namespace}_{self._zone_id}_{self._usage_type}"
+        self._attr_name = f"{usage_type}"
+        # dict source_id -> source name
+        self._source_id_name = {int(index): source for index, source in sources.items()}
+
+        if(usage_type == "On time"):
+            self._attr_icon = "mdi:timer-music"
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.HOURS
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        elif(usage_type == "Volume time"):
+            # hours at full volume: the change over a period divided by the change
+            # in On time gives the average volume for that period
+            self._attr_icon = "mdi:volume-medium"
+            self._attr_native_unit_of_measurement = UnitOfTime.HOURS
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self):
+        """Return the accumulated value."""
+        usage = self.coordinator.usage
+        if(self._usage_type == "On time"):
+            return round(usage.on_time(self._zone_id) / 3600, 3)
+        if(self._usage_type == "Volume time"):
+            return round(usage.volume_time(self._zone_id) / MAX_VOLUME / 3600, 3)
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the hours spent on each source, or the lifetime average volume."""
+        if(self._usage_type == "Volume time"):
+            if (volume := self.coordinator.usage.average_volume(self._zone_id)) is None:
+                return None
+            return {"average_volume": round(volume / MAX_VOLUME * 100, 1)}
+        if(self._usage_type != "On time"):
+            return None
+        source_time = self.coordinator.usage.source_time(self._zone_id)
+        return {
+            "source_hours": {
+                self._source_id_name.get(index + 1, f"Source {index + 1}"): round(seconds / 3600, 3)
+                for index, seconds in enumerate(source_time)
+            }
+        }
+
+
+class MonopriceZoneSourceUsageSensor(MonopriceZoneDeviceEntity, SensorEntity):
+    """Hours a Monoprice amplifier zone has spent on one source."""
+
+    _attr_icon = "mdi:timer-music-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, namespace, zone_id, source_id, source_name):
+        """Initialize new zone source usage sensors."""
+        super().__init__(coordinator, namespace, zone_id)
+        self._source_id = source_id
+        self._attr_unique_id = f"{namespace}_{self._zone_id}_source_{source_id}_time"
+        self._attr_name = f"{source_name} time"
+
     @property
     def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added to the entity registry."""
-        if(self._zone_id == 10 or self._zone_id == 20 or self._zone_id == 30):
-            return False
-        return self._zone_id < 20 or self._update_success
+        """Return False, one sensor per zone and source is only needed for reports."""
+        return False
+
+    @property
+    def native_value(self):
+        """Return the hours spent on this source."""
+        seconds = self.coordinator.usage.source_time(self._zone_id)[self._source_id - 1]
+        return round(seconds / 3600, 3)
+
+
+class MonopriceZonesOnSensor(MonopriceStackEntity, SensorEntity):
+    """Number of zones that are on across the amplifier stack."""
+
+    _attr_icon = "mdi:speaker-multiple"
+    _attr_name = "Zones on"
+
+    def __init__(self, coordinator, namespace, name, sources):
+        """Initialize the sensor."""
+        super().__init__(coordinator, namespace, name)
+        self._attr_unique_id = f"{namespace}_zones_on"
+        # dict source_id -> source name
+        self._source_id_name = {int(index): source for index, source in sources.items()}
+
+    @property
+    def native_value(self):
+        """Return the number of zones that are on."""
+        # the count is unknown until every zone has been read once
+        if not self.coordinator.zones_counted():
+            return None
+        return len(self.coordinator.aggregates.zones_on)
+
+    @property
+    def extra_state_attributes(self):
+        """Return which zones are on, unmuted and playing each source."""
+        if not self.coordinator.zones_counted():
+            return None
+        aggregates = self.coordinator.aggregates
+        return {
+            "zones": sorted(aggregates.zones_on),
+            "unmuted_zones": sorted(aggregates.unmuted_zones),
+            "any_unmuted": bool(aggregates.unmuted_zones),
+            "sources": {
+                source: sorted(aggregates.source_zones.get(source_id, ()))
+                for source_id, source in self._source_id_name.items()
+            },
+        }
+
+
+class MonopriceSourceSensor(MonopriceStackEntity, SensorEntity):
+    """Number of zones that are on and playing a given source."""
+
+    _attr_icon = "mdi:import"
+
+    def __init__(self, coordinator, namespace, name, source_id, source_name):
+        """Initialize the sensor."""
+        super().__init__(coordinator, namespace, name)
+        self._source_id = source_id
+        self._attr_unique_id = f"{namespace}_source_{source_id}_zones"
+        self._attr_name = f"{source_name} zones"
+
+    @property
+    def native_value(self):
+        """Return the number of zones playing this source."""
+        if not self.coordinator.zones_counted():
+            return None
+        return len(self.coordinator.aggregates.source_zones.get(self._source_id, ()))
+
+    @property
+    def extra_state_attributes(self):
+        """Return the zones playing this source."""
+        if not self.coordinator.zones_counted():
+            return None
+        return {
+            "zones": sorted(self.coordinator.aggregates.source_zones.get(self._source_id, ()))
+        }
+
+
+class MonopriceUnitPowerSensor(MonopriceStackEntity, SensorEntity):
+    """Whether any zone of one amplifier unit is on."""
+
+    _attr_icon = "mdi:power"
+
+    def __init__(self, coordinator, namespace, name, unit):
+        """Initialize the sensor."""
+        super().__init__(coordinator, namespace, name)
+        self._unit = unit
+        self._attr_unique_id = f"{namespace}_unit_{unit}_power"
+        self._attr_name = f"Unit {unit} power"
+
+    @property
+    def available(self) -> bool:
+        """Return True if the unit answered when the stack was identified."""
+        return super().available and self._unit in self.coordinator.bus.units
+
+    @property
+    def native_value(self):
+        """Return On if any zone of this unit is on."""
+        if not self.coordinator.zones_counted(self._unit):
+            return None
+        return '{}'.format('On' if self.coordinator.aggregates.unit_zones_on.get(self._unit) else 'Off')
+
+    @property
+    def extra_state_attributes(self):
+        """Return the zones of this unit that are on."""
+        if not self.coordinator.zones_counted(self._unit):
+            return None
+        return {
+            "zones": sorted(self.coordinator.aggregates.unit_zones_on.get(self._unit, ()))
+        }
+
+
+class MonopriceUnitReplyTimeSensor(MonopriceStackEntity, SensorEntity):
+    """Measured reply time of one amplifier unit and the pacing learned from it."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-outline"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator, namespace, name, unit):
+        """Initialize the sensor."""
+        super().__init__(coordinator, namespace, name)
+        self._unit = unit
+        self._attr_unique_id = f"{namespace}_unit_{unit}_reply_time"
+        self._attr_name = f"Unit {unit} reply time"
+
+    @property
+    def available(self) -> bool:
+        """Return True if the unit answered when the stack was identified."""
+        return super().available and self._unit in self.coordinator.bus.units
+
+    @property
+    def native_value(self):
+        """Return the 95th percentile reply time."""
+        if (seconds := self.coordinator.bus.pacing[self._unit].percentile(95)) is None:
+            return None
+        return round(seconds * 1000)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the learned timeout and gap."""
+        pacing = self.coordinator.bus.pacing[self._unit]
+        return {
+            "timeout_ms": round(pacing.timeout * 1000),
+            "gap_ms": round(pacing.gap * 1000),
+            "samples": pacing.samples,
+            "dropped": pacing.drops,
+        }
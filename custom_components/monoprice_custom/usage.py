@@ -0,0 +1,112 @@
+"""Per-zone usage statistics for the Monoprice 6-Zone Amplifier integration."""
+from __future__ import annotations
+
+import time
+
+from pymonoprice import ZoneStatus
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+
+# longest gap between two readings that still counts as continuous listening
+MAX_SAMPLE_GAP = 300
+
+SOURCE_COUNT = 6
+
+# layout of the counters kept for each zone, all in seconds
+ON_TIME = 0
+VOLUME_TIME = 1
+SOURCE_TIME = 2
+
+
+class ZoneUsage:
+    """Accumulate on-time, volume and source usage from zone readings.
+
+    Every zone has a fixed list of counters: seconds on, volume integrated
+    over the seconds on, and seconds on each source. A reading credits the
+    time since the zone's previous reading to the state seen then, so the
+    totals only ever need the latest reading and never the state history.
+    """
+
+    def __init__(self, hass: HomeAssistant, namespace: str) -> None:
+        """Initialize usage tracking for a config entry."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.usage.{namespace}")
+        self._counters: dict[int, list[float]] = {}
+        # zone_id -> (time.monotonic(), status) of the previous reading
+        self._last: dict[int, tuple[float, ZoneStatus]] = {}
+        # True while a delayed save is scheduled
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the counters saved by a previous run."""
+        if (data := await self._store.async_load()) is not None:
+            self._counters = {
+                int(zone_id): counters for zone_id, counters in data["zones"].items()
+            }
+
+    async def async_save(self) -> None:
+        """Save the counters now."""
+        await self._store.async_save(self._data_to_save())
+
+    def update(self, zone_id: int, status: ZoneStatus | None) -> None:
+        """Credit the time since the zone's previous reading."""
+        if status is None:
+            return
+        now = time.monotonic()
+        previous = self._last.get(zone_id)
+        self._last[zone_id] = (now, status)
+        if previous is None:
+            return
+        last_time, last_status = previous
+        elapsed = now - last_time
+        if not last_status.power or elapsed > MAX_SAMPLE_GAP:
+            return
+
+        counters = self._counters.setdefault(zone_id, [0.0] * (SOURCE_TIME + SOURCE_COUNT))
+        counters[ON_TIME] += elapsed
+        counters[VOLUME_TIME] += last_status.volume * elapsed
+        if 1 <= last_status.source <= SOURCE_COUNT:
+            counters[SOURCE_TIME + last_status.source - 1] += elapsed
+        # async_delay_save restarts its timer on every call, so with zones read
+        # every few seconds only the first change after a save may schedule one
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def on_time(self, zone_id: int) -> float:
+        """Return the total seconds the zone has been on."""
+        if (counters := self._counters.get(zone_id)) is None:
+            return 0.0
+        return counters[ON_TIME]
+
+    def volume_time(self, zone_id: int) -> float:
+        """Return the volume (0..38) integrated over the seconds the zone was on."""
+        if (counters := self._counters.get(zone_id)) is None:
+            return 0.0
+        return counters[VOLUME_TIME]
+
+    def average_volume(self, zone_id: int) -> float | None:
+        """Return the mean volume (0..38) while the zone was on."""
+        if (counters := self._counters.get(zone_id)) is None or not counters[ON_TIME]:
+            return None
+        return counters[VOLUME_TIME] / counters[ON_TIME]
+
+    def source_time(self, zone_id: int) -> list[float]:
+        """Return the seconds spent on each source, source 1 first."""
+        if (counters := self._counters.get(zone_id)) is None:
+            return [0.0] * SOURCE_COUNT
+        return counters[SOURCE_TIME:]
+
+    def _data_to_save(self) -> dict:
+        """Return the counters in storable form."""
+        self._save_scheduled = False
+        return {
+            "zones": {
+                str(zone_id): counters for zone_id, counters in self._counters.items()
+            }
+        }